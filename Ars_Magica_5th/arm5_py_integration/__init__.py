@@ -1,8 +1,8 @@
 """Module for providing the parts in the template.html file"""
 import csv
+import itertools
 import re
-import textwrap
-from pathlib import Path
+from typing import List, Optional
 
 import markdown
 from bs4 import BeautifulSoup as soup
@@ -15,7 +15,7 @@ from . import (
     tab_5_spells,
     tab_6_sheet,
 )
-from .helpers import xp
+from .helpers import PACKAGE_DIR, SHEET_DIR, xp
 from .translations import translation_attrs, translation_attrs_setup
 
 # Alert system to display update notes and warnings on top of the sheet
@@ -26,6 +26,26 @@ from .translations import translation_attrs, translation_attrs_setup
 
 # The system works by assigning an ID, either int or str, to each alerts, and
 # using an attribute to hide the alert once it has been closed
+ALERT_LEVELS = frozenset({"info", "warning"})
+ALERT_TEMPLATE = """\
+<input type="hidden" class="alert-hidder" name="attr_alert-{aid}" value="0"/>
+<div class="alert alert-{level}">
+    <div>
+        <h3> {level_title} - {title}</h3>
+{text}
+    </div>
+    <label class="fakebutton">
+        <input type="checkbox" name="attr_alert-{aid}" value="1" /> ×
+    </label>
+</div>"""
+
+# Internal state of the alert system. Numeric IDs are given in order from 0, so
+# only their count is kept, while string IDs are kept for disable_old_alerts()
+_alert_numid_count = 0
+_alert_strids: List[str] = []
+_alerts_disabled = False
+
+
 def alert(title: str, text: str, *, level: str = "warning", ID: str = None):
     """
     Generate the HTML to display a banner that can be permanently hidden
@@ -39,58 +59,52 @@ def alert(title: str, text: str, *, level: str = "warning", ID: str = None):
         ID: optional string ID of this banner, if you need to check if it is
             open/closed somewhere. Do NOT use numbers
     """
-    if not level in ("info", "warning"):
+    global _alert_numid_count
+    if level not in ALERT_LEVELS:
         raise ValueError("Level must be among 'info', 'warning'")
-    if alert.has_disable_been_called:
+    if _alerts_disabled:
         raise RuntimeError(
             "The function alert() is called after disable_old_alert() has generated "
             "the javascript code to handle hidding closed alerts. This breaks the "
             "system completely, make sure disable_old_alerts is called last"
         )
     if ID is None:
-        alert_id = alert.numid
-        alert.numid += 1
+        alert_id = _alert_numid_count
+        _alert_numid_count += 1
     else:
         alert_id = str(ID)
-        alert.strid.append(alert_id)
-
-    indent = " " * 4 * 4
-    text = str(text).replace("\n", "\n" + indent)
-    return textwrap.dedent(
-        f"""\
-        <input type="hidden" class="alert-hidder" name="attr_alert-{alert_id}" value="0"/>
-        <div class="alert alert-{level}">
-            <div>
-                <h3> {level.title()} - {title}</h3>
-                {text}
-            </div>
-            <label class="fakebutton">
-                <input type="checkbox" name="attr_alert-{alert_id}" value="1" /> ×
-            </label>
-        </div>"""
+        _alert_strids.append(alert_id)
+
+    # Blank lines are left empty, as textwrap.dedent() used to leave them
+    indent = " " * 4 * 2
+    text = "\n".join(
+        indent + line if line.strip() else "" for line in str(text).split("\n")
+    )
+    return ALERT_TEMPLATE.format(
+        aid=alert_id, level=level, level_title=level.title(), title=title, text=text
     )
 
 
-# python supports attributes on function
-# we use that to store the internal variable used by the function
-alert.numid = 0
-alert.strid = []
-alert.has_disable_been_called = False
+# Lines generated by disable_old_alerts(). No alert can be created once it has
+# been called, so they are computed on the first call only
+_alert_lines: Optional[str] = None
 
 
 def disable_old_alerts(marker: str):
-    alert.has_disable_been_called = True
-    indent = " " * 4 * 3
-    lines = f",\n{indent}".join(
-        f'"alert-{i}": 1' for i in list(range(alert.numid)) + alert.strid
-    )
-    return textwrap.dedent(
-        f"""\
-        setAttrs({{
-            "{marker}": 1,
-            {lines}
-        }}); """
-    )
+    global _alerts_disabled, _alert_lines
+    _alerts_disabled = True
+    if _alert_lines is None:
+        indent = " " * 4
+        _alert_lines = f",\n{indent}".join(
+            f'"alert-{i}": 1'
+            for i in itertools.chain(range(_alert_numid_count), _alert_strids)
+        )
+    lines = _alert_lines
+    return f"""\
+setAttrs({{
+    "{marker}": 1,
+    {lines}
+}}); """
 
 
 # Add new parts to this dictionary
@@ -125,48 +139,56 @@ EXPORTS["botch_separate"] = (
 )
 
 # Colors for the "custom" rolltemplate, loaded from css_colors.csv
-with open(
-    Path(__file__).parent / "css_colors.csv", newline="", encoding="utf-8"
-) as file:
-    reader = csv.DictReader(file)
+LUMA_THRESHOLD = 5000 * 255
+with open(PACKAGE_DIR / "css_colors.csv", newline="", encoding="utf-8") as file:
+    reader = csv.reader(file)
+    # An empty file has no header, and no rows either
+    header = next(reader, ["color", "hex"])
+    color_col, hex_col = header.index("color"), header.index("hex")
     css_rules = []
-    for color_def in reader:
-        # Base CSS rules
-        lines_header = [
-            f".sheet-rolltemplate-custom .sheet-crt-container.sheet-crt-color-{color_def['color']} {{",
-            f"    --header-bg-color: {color_def['hex']};",
-        ]
-        lines_rolls = [
-            f".sheet-rolltemplate-custom .sheet-crt-container.sheet-crt-rlcolor-{color_def['color']} .inlinerollresult {{",
-            f"    --roll-bg-color: {color_def['hex']};",
-        ]
-        lines_buttons = [
-            f".sheet-rolltemplate-custom .sheet-crt-container.sheet-crt-btcolor-{color_def['color']} a {{",
-            f"    --button-bg-color: {color_def['hex']};",
-        ]
+    for row in reader:
+        # Blank lines, skipped like csv.DictReader does
+        if not row:
+            continue
+        color, hex_color = row[color_col], row[hex_col]
 
         # Adapt text color to background color
-        hex_color = color_def["hex"].lstrip("#")
-        r, g, b = tuple(int(hex_color[2 * i : 2 * i + 2], 16) / 255 for i in range(3))
+        value = int(hex_color.lstrip("#"), 16)
         # Assuming sRGB -> Luma
         # may need fixing, color spaces are confusing
-        luma = 0.2126 * r + 0.7152 * g + 0.0722 * b
-        if luma > 0.5:  # arbitrary threshold
-            # switch to black text if luma is high enough
-            lines_header.append("    --header-text-color: #000;")
-            lines_buttons.append("    --button-text-color: #000;")
-        if luma < 0.5:
-            lines_rolls.append("    --roll-text-color: #FFF;")
-
-        # Build the rules
-        for lines in (lines_header, lines_rolls, lines_buttons):
-            lines.append("}")
-            css_rules.append("\n".join(lines))
+        # Computed in integers: the coefficients are scaled by 10000 and the
+        # channels are kept in 0-255, so 0.5 becomes LUMA_THRESHOLD
+        luma = (
+            2126 * (value >> 16 & 0xFF)
+            + 7152 * (value >> 8 & 0xFF)
+            + 722 * (value & 0xFF)
+        )
+        # switch to black text if luma is high enough, arbitrary threshold
+        header_text, button_text = (
+            ("\n    --header-text-color: #000;", "\n    --button-text-color: #000;")
+            if luma > LUMA_THRESHOLD
+            else ("", "")
+        )
+        roll_text = "\n    --roll-text-color: #FFF;" if luma < LUMA_THRESHOLD else ""
+
+        # Build the header, rolls and buttons rules at once
+        css_rules.append(
+            f"""\
+.sheet-rolltemplate-custom .sheet-crt-container.sheet-crt-color-{color} {{
+    --header-bg-color: {hex_color};{header_text}
+}}
+.sheet-rolltemplate-custom .sheet-crt-container.sheet-crt-rlcolor-{color} .inlinerollresult {{
+    --roll-bg-color: {hex_color};{roll_text}
+}}
+.sheet-rolltemplate-custom .sheet-crt-container.sheet-crt-btcolor-{color} a {{
+    --button-bg-color: {hex_color};{button_text}
+}}"""
+        )
 
     EXPORTS["custom_rt_color_css"] = "*/\n" + "\n".join(css_rules) + "\n/*"
 
 # Load the changelog file, parse it to HTML
-with open(Path(__file__).parents[1] / "changelog.md", encoding="utf-8") as file:
+with open(SHEET_DIR / "changelog.md", encoding="utf-8") as file:
     html = markdown.markdown("".join(file))
 # Parse the HTML
 html = soup(html, "html.parser")
@@ -2,13 +2,18 @@
 Small module for helper code that could be helpful everywhere in the part module
 """
 
+import functools
 import itertools
-import textwrap
 from dataclasses import dataclass
+from pathlib import Path
 from typing import ClassVar, Collection, Dict, List, Set, Tuple, Union
 
 # Useful constants
-CHARACTERISTICS = [
+# Directory of this package, and of the sheet containing it
+PACKAGE_DIR = Path(__file__).resolve().parent
+SHEET_DIR = PACKAGE_DIR.parent
+
+CHARACTERISTICS = (
     "intelligence",
     "perception",
     "presence",
@@ -17,16 +22,16 @@ CHARACTERISTICS = [
     "stamina",
     "dexterity",
     "quickness",
-]
-TECHNIQUES = [
+)
+TECHNIQUES = (
     "creo",
     "intellego",
     "muto",
     "perdo",
     "rego",
-]
+)
 
-FORMS = [
+FORMS = (
     "animal",
     "aquam",
     "auram",
@@ -37,7 +42,20 @@ FORMS = [
     "mentem",
     "terram",
     "vim",
-]
+)
+
+# (lowercase, Capitalized) variants of the names above
+CHARACTERISTICS_PAIRS = tuple((char, char.capitalize()) for char in CHARACTERISTICS)
+TECHNIQUES_PAIRS = tuple((tech, tech.capitalize()) for tech in TECHNIQUES)
+FORMS_PAIRS = tuple((form, form.capitalize()) for form in FORMS)
+
+# Roll parts shared by many rolls
+ROLL_AURA = "(@{aura}) [@{aura_i18n}]"
+ROLL_CIRCUMSTANCES = "(?{@{circumstantial_i18n}|0}) [@{circumstances_i18n}]"
+ROLL_FATIGUE = "([[floor(@{Fatigue})]]) [@{fatigue_i18n}]"
+ROLL_MODIFIERS = "(?{@{modifiers_i18n}|0}) [@{modifiers_i18n}]"
+ROLL_STAMINA = "(@{Stamina_Score}) [@{stamina_i18n}]"
+ROLL_WOUNDS = "(@{wound_total}) [@{wounds_i18n}]"
 
 
 def _match_lengths(
@@ -115,8 +133,10 @@ def repeat_format(
     if replace is not None and by is not None:
         # simple formatting with str.replace()
         return separator.join(
-            string.replace(key, value)
-            for key, value in _match_lengths(replace, by, "'replace'", "'by'")
+            [
+                string.replace(key, value)
+                for key, value in _match_lengths(replace, by, "'replace'", "'by'")
+            ]
         )
     elif (keys is not None and values is not None) or keyvalues is not None:
         # dictionary formatting
@@ -127,17 +147,69 @@ def repeat_format(
         else:
             raise RuntimeError
         return separator.join(
-            string
-            % {key.lower(): value.lower(), key.title(): value.title(), key: value}
-            for key, value in pairs
+            [
+                string
+                % {key.lower(): value.lower(), key.title(): value.title(), key: value}
+                for key, value in pairs
+            ]
         )
 
 
+def repeat_format_pairs(
+    string: str,
+    pairs: Collection[Tuple[str, str]],
+    *,
+    keys: Tuple[str, str],
+    separator: str = "\n",
+):
+    """
+    Repeatedly format a string with precomputed pairs and concatenate the results
+
+    This is the "%"-style formatting of `repeat_format`, for values whose
+    lowercase and capitalized variants are already known, such as
+    `CHARACTERISTICS_PAIRS`.
+
+    Arguments:
+        string: str object to repeatedly format
+        pairs: collection of (lowercase, Capitalized) values
+        keys: the lowercase and capitalized keys to replace
+        separator: string inserted between the formatted strings
+    """
+    lkey, ckey = keys
+    return separator.join([string % {lkey: low, ckey: cap} for low, cap in pairs])
+
+
 def enumerate_helper(iterable, funcs=(), start=0):
     for i, v in enumerate(iterable, start=start):
         yield (i, v, *tuple(f(v) for f in funcs))
 
 
+# HTML of the Xp parts of arts & abilities, see xp()
+_XP_TEMPLATE = """\
+<span class="flex-container-left">
+    <span class="has-tooltip">
+        <input type="text" class="number-xp" name="attr_{name}{suffix}" value="0"/>
+        <span class="tooltip" data-i18n="tooltip-xp-input">
+            XP points in this art or ability. You can store either the total amount of XP, or just the XP towards the next score.
+        </span>
+    </span>
+    <span class="flex-container-center">
+        (
+        <span class="has-tooltip">
+            <input type="number" class="number-xp advance" name="attr_{name}{adv_suffix}" value="{factor} * ((@{{{name}_Score}}) + 1)" disabled="true"/>
+            <span class="tooltip" style="width: 200px; margin-left: -100px;" data-i18n="tooltip-xp-step">Additional XP required for the next score, beyond the XP for the current level.<br>If you store only the XP towards the next score in the xp input, increase the score when this amount is reached.</span>
+        </span>
+        /
+        <span class="has-tooltip">
+            <input type="number" class="number-xp total" name="attr_{name}{tot_suffix}" value="{factor} * (((@{{{name}_Score}}) + 1) * ((@{{{name}_Score}}) + 2) / 2)" disabled="true"/>
+            <span class="tooltip" style="width: 200px; margin-left: -100px;" data-i18n="tooltip-xp-total">Total XP required for the next score.<br>If you store the total XP in the XP input, increase the score when this amount is reached.</span>
+        </span>
+        )
+    </span>
+</span>
+"""
+
+
 def xp(
     name: str,
     *,
@@ -149,30 +221,12 @@ def xp(
     """
     Generate the HTML for the Xp parts of arts & abilities
     """
-    return textwrap.dedent(
-        f"""\
-        <span class="flex-container-left">
-            <span class="has-tooltip">
-                <input type="text" class="number-xp" name="attr_{name}{suffix}" value="0"/>
-                <span class="tooltip" data-i18n="tooltip-xp-input">
-                    XP points in this art or ability. You can store either the total amount of XP, or just the XP towards the next score.
-                </span>
-            </span>
-            <span class="flex-container-center">
-                (
-                <span class="has-tooltip">
-                    <input type="number" class="number-xp advance" name="attr_{name}{adv_suffix}" value="{factor} * ((@{{{name}_Score}}) + 1)" disabled="true"/>
-                    <span class="tooltip" style="width: 200px; margin-left: -100px;" data-i18n="tooltip-xp-step">Additional XP required for the next score, beyond the XP for the current level.<br>If you store only the XP towards the next score in the xp input, increase the score when this amount is reached.</span>
-                </span>
-                /
-                <span class="has-tooltip">
-                    <input type="number" class="number-xp total" name="attr_{name}{tot_suffix}" value="{factor} * (((@{{{name}_Score}}) + 1) * ((@{{{name}_Score}}) + 2) / 2)" disabled="true"/>
-                    <span class="tooltip" style="width: 200px; margin-left: -100px;" data-i18n="tooltip-xp-total">Total XP required for the next score.<br>If you store the total XP in the XP input, increase the score when this amount is reached.</span>
-                </span>
-                )
-            </span>
-        </span>
-        """
+    return _XP_TEMPLATE.format(
+        name=name,
+        suffix=suffix,
+        adv_suffix=adv_suffix,
+        tot_suffix=tot_suffix,
+        factor=factor,
     )
 
 
@@ -271,16 +325,18 @@ class RollTemplate:
             )
         return " ".join(parts)
 
-    @property
+    # The rendered strings are cached: the fields are not modified after the
+    # creation, and the same template is often rendered multiple times
+    @functools.cached_property
     def no_roll(self) -> str:
         return self._base(with_roll=False)
 
-    @property
+    @functools.cached_property
     def simple(self) -> str:
         s = self._base() + " {{stress=}}"
         return s % {"die": "@{simple-die}"}
 
-    @property
+    @functools.cached_property
     def stress(self) -> str:
         s = self._base() + " {{stress=1}}"
         return s % {"die": "@{stress-die}"}
@@ -313,5 +369,5 @@ def rolltemplate(
         fields = {}
     if duplicates := fields.keys() & kwargs.keys():
         raise ValueError("Duplicated fields: " + ", ".join(duplicates))
-    fields.update(kwargs)
-    return RollTemplate(template, fields, botch=botch, critical=critical)
+    # The fields are copied, leaving the caller's dict untouched
+    return RollTemplate(template, {**fields, **kwargs}, botch=botch, critical=critical)
@@ -1,15 +1,22 @@
-import textwrap
-
-from .helpers import CHARACTERISTICS, repeat_format, roll, rolltemplate
+from .helpers import (
+    CHARACTERISTICS,
+    CHARACTERISTICS_PAIRS,
+    ROLL_CIRCUMSTANCES,
+    ROLL_FATIGUE,
+    ROLL_WOUNDS,
+    repeat_format_pairs,
+    roll,
+    rolltemplate,
+)
 
 EXPORTS = {}
 
 # Characteristics definitions
 characteristic_roll = roll(
     "(@{%%(Char)s_Score}) [@{%%(char)s_i18n}]",
-    "(@{wound_total}) [@{wounds_i18n}]",
-    "([[floor(@{Fatigue})]]) [@{fatigue_i18n}]",
-    "(?{@{circumstantial_i18n}|0}) [@{circumstances_i18n}]",
+    ROLL_WOUNDS,
+    ROLL_FATIGUE,
+    ROLL_CIRCUMSTANCES,
 )
 characteristic_template = rolltemplate(
     "ability",
@@ -24,78 +31,72 @@ characteristic_template = rolltemplate(
     label3="^{circumstances-m}",
     result3="[[(?{@{circumstantial_i18n}|0})]]",
 )
-EXPORTS["mental_characteristic_rows"] = repeat_format(
-    textwrap.dedent(
-        f"""\
-        <tr>
-            <th data-i18n="%(char)s" >%(Char)s</th>
-            <td><input type="text" class="heading_2" name="attr_%(Char)s_Description"/></td>
-            <td><input type="text" class="number_1" name="attr_%(Char)s_Score" value="0"/></td>
-            <td><input type="text" class="number_1" name="attr_%(Char)s_Aging" value="0"/></td>
-            <td><div class="flex-container-center">
-                <button type="roll" class="button simple-roll" name="roll_%(Char)s_simple" value="{characteristic_template.simple}"></button>
-                <button type="roll" class="button stress-roll" name="roll_%(Char)s_stress" value="{characteristic_template.stress}"></button>
-            </div></td>
-        </tr>"""
-    ),
-    keys="char",
-    values=CHARACTERISTICS[:4],
-)
-
-EXPORTS["physical_characteristic_rows"] = repeat_format(
-    textwrap.dedent(
-        f"""\
-        <tr>
-            <th data-i18n="%(char)s" >%(Char)s</th>
-            <td><input type="text" class="heading_2" name="attr_%(Char)s_Description"/></td>
-            <td><input type="text" class="number_1" name="attr_%(Char)s_Score" value="0"/></td>
-            <td><input type="text" class="number_1" name="attr_%(Char)s_Aging" value="0"/></td>
-            <td><div class="flex-container-center">
-                <button type="roll" class="button simple-roll" name="roll_%(Char)s_simple" value="{characteristic_template.simple}"></button>
-                <button type="roll" class="button stress-roll" name="roll_%(Char)s_stress" value="{characteristic_template.stress}"></button>
-            </div></td>
-        </tr>"""
-    ),
-    keys="char",
-    values=CHARACTERISTICS[4:],
+characteristic_row_template = f"""\
+<tr>
+    <th data-i18n="%(char)s" >%(Char)s</th>
+    <td><input type="text" class="heading_2" name="attr_%(Char)s_Description"/></td>
+    <td><input type="text" class="number_1" name="attr_%(Char)s_Score" value="0"/></td>
+    <td><input type="text" class="number_1" name="attr_%(Char)s_Aging" value="0"/></td>
+    <td><div class="flex-container-center">
+        <button type="roll" class="button simple-roll" name="roll_%(Char)s_simple" value="{characteristic_template.simple}"></button>
+        <button type="roll" class="button stress-roll" name="roll_%(Char)s_stress" value="{characteristic_template.stress}"></button>
+    </div></td>
+</tr>"""
+EXPORTS.update(
+    {
+        "mental_characteristic_rows": repeat_format_pairs(
+            characteristic_row_template,
+            CHARACTERISTICS_PAIRS[:4],
+            keys=("char", "Char"),
+        ),
+        "physical_characteristic_rows": repeat_format_pairs(
+            characteristic_row_template,
+            CHARACTERISTICS_PAIRS[4:],
+            keys=("char", "Char"),
+        ),
+    }
 )
 
 # Characteristic options
-EXPORTS["characteristic_score_options"] = repeat_format(
-    """<option value="@{%(Char)s_Score}" data-i18n="%(char)s" >%(Char)s</option>""",
-    keys="char",
-    values=CHARACTERISTICS,
-)
-EXPORTS["characteristic_score_ask"] = (
-    "?{@{characteristic_i18n}|"
-    + "| ".join(
-        "@{%(char)s_i18n}, @{%(Char)s_Score} [@{%(char)s_i18n}]"
-        % {"char": char, "Char": char.capitalize()}
-        for char in CHARACTERISTICS
-    )
-    + "}"
-)
-EXPORTS["characteristic_name_options"] = repeat_format(
-    """<option value="%(Char)s" data-i18n="%(char)s" >%(Char)s</option>""",
-    keys="char",
-    values=CHARACTERISTICS,
-)
-EXPORTS["characteristic_name_ask_attr"] = (
-    "?{@{characteristic_i18n}|"
-    + "| ".join(
-        "@{%(char)s_i18n},@{%(char)s_Score} [@{%(char)s_i18n}]" % {"char": char}
-        for char in CHARACTERISTICS
-    )
-    + "}"
+EXPORTS.update(
+    {
+        "characteristic_score_options": repeat_format_pairs(
+            """<option value="@{%(Char)s_Score}" data-i18n="%(char)s" >%(Char)s</option>""",
+            CHARACTERISTICS_PAIRS,
+            keys=("char", "Char"),
+        ),
+        "characteristic_score_ask": (
+            "?{@{characteristic_i18n}|"
+            + "| ".join(
+                f"@{{{char}_i18n}}, @{{{Char}_Score}} [@{{{char}_i18n}}]"
+                for char, Char in CHARACTERISTICS_PAIRS
+            )
+            + "}"
+        ),
+        "characteristic_name_options": repeat_format_pairs(
+            """<option value="%(Char)s" data-i18n="%(char)s" >%(Char)s</option>""",
+            CHARACTERISTICS_PAIRS,
+            keys=("char", "Char"),
+        ),
+        "characteristic_name_ask_attr": (
+            "?{@{characteristic_i18n}|"
+            + "| ".join(
+                f"@{{{char}_i18n}},@{{{char}_Score}} [@{{{char}_i18n}}]"
+                for char in CHARACTERISTICS
+            )
+            + "}"
+        ),
+    }
 )
 
+
 # Abilities
 ability_roll = roll(
     "(@{Ability_Score} + @{Ability_Puissant}) [@{Ability_name}]",
     "(@{sys_at}@{character_name}@{sys_pipe}@{Ability_CharacName}_Score@{sys_rbk}) [@{sys_at}@{character_name}@{sys_pipe}@{Ability_CharacName}_i18n@{sys_rbk}]",
-    "(@{wound_total}) [@{wounds_i18n}]",
-    "([[floor(@{Fatigue})]]) [@{fatigue_i18n}]",
-    "(?{@{circumstantial_i18n}|0}) [@{circumstances_i18n}]",
+    ROLL_WOUNDS,
+    ROLL_FATIGUE,
+    ROLL_CIRCUMSTANCES,
 )
 ability_template = rolltemplate(
     "ability",
@@ -113,5 +114,9 @@ ability_template = rolltemplate(
     result4="[[ (?{@{circumstantial_i18n}|0}) ]]",
 )
 
-EXPORTS["ability_roll_simple"] = ability_template.simple
-EXPORTS["ability_roll_stress"] = ability_template.stress
+EXPORTS.update(
+    {
+        "ability_roll_simple": ability_template.simple,
+        "ability_roll_stress": ability_template.stress,
+    }
+)
@@ -1,10 +1,13 @@
-import textwrap
-
 from .helpers import (
-    FORMS,
-    TECHNIQUES,
+    FORMS_PAIRS,
+    ROLL_AURA,
+    ROLL_FATIGUE,
+    ROLL_MODIFIERS,
+    ROLL_STAMINA,
+    ROLL_WOUNDS,
+    TECHNIQUES_PAIRS,
     enumerate_helper,
-    repeat_format,
+    repeat_format_pairs,
     roll,
     rolltemplate,
     xp,
@@ -12,83 +15,83 @@ from .helpers import (
 
 EXPORTS = {}
 
+# Arts definitions, shared by techniques and forms
+art_template = f"""\
+<tr>
+    <td><input type="text" class="number_3" name="attr_%(Art)s_Score" value="0"/></td>
+    <td data-i18n="%(art)s" >%(Art)s</td>
+    <td>{xp("%(Art)s", factor=1)}</td>
+    <td style="text-align: center"><input type="text" class="number_3 minor" name="attr_%(Art)s_Puissant" value="0"/></td>
+</tr>"""
+
 # Technique definitions
-EXPORTS["technique_definitions"] = repeat_format(
-    textwrap.dedent(
-        f"""\
-        <tr>
-            <td><input type="text" class="number_3" name="attr_%(Tech)s_Score" value="0"/></td>
-            <td data-i18n="%(tech)s" >%(Tech)s</td>
-            <td>{xp("%(Tech)s", factor=1)}</td>
-            <td style="text-align: center"><input type="text" class="number_3 minor" name="attr_%(Tech)s_Puissant" value="0"/></td>
-        </tr>"""
-    ),
-    keys="tech",
-    values=TECHNIQUES,
+EXPORTS["technique_definitions"] = repeat_format_pairs(
+    art_template, TECHNIQUES_PAIRS, keys=("art", "Art")
 )
 
 
 # Technique options
-EXPORTS["technique_score_options"] = repeat_format(
-    """<option value="(@{%(Tech)s_Score} + @{%(Tech)s_Puissant}) [@{%(tech)s_i18n}]" data-i18n="%(tech)s" >%(Tech)s</option>""",
-    keys="tech",
-    values=TECHNIQUES,
-)
-EXPORTS["technique_score_options_unlabeled"] = repeat_format(
-    """<option value="@{%(Tech)s_Score} + @{%(Tech)s_Puissant}" data-i18n="%(tech)s" >%(Tech)s</option>""",
-    keys="tech",
-    values=TECHNIQUES,
-)
-EXPORTS["technique_name_options"] = repeat_format(
-    """<option value="%(Tech)s" data-i18n="%(tech)s" >%(Tech)s</option>""",
-    keys="tech",
-    values=TECHNIQUES,
-)
-
-EXPORTS["technique_enumerated_options"] = "\n".join(
-    f"""<option value="{index}" data-i18n="{tech.lower()}" >{tech.title()}</option>"""
-    for index, tech in enumerate(TECHNIQUES, start=1)
+EXPORTS.update(
+    {
+        "technique_score_options": repeat_format_pairs(
+            """<option value="(@{%(Tech)s_Score} + @{%(Tech)s_Puissant}) [@{%(tech)s_i18n}]" data-i18n="%(tech)s" >%(Tech)s</option>""",
+            TECHNIQUES_PAIRS,
+            keys=("tech", "Tech"),
+        ),
+        "technique_score_options_unlabeled": repeat_format_pairs(
+            """<option value="@{%(Tech)s_Score} + @{%(Tech)s_Puissant}" data-i18n="%(tech)s" >%(Tech)s</option>""",
+            TECHNIQUES_PAIRS,
+            keys=("tech", "Tech"),
+        ),
+        "technique_name_options": repeat_format_pairs(
+            """<option value="%(Tech)s" data-i18n="%(tech)s" >%(Tech)s</option>""",
+            TECHNIQUES_PAIRS,
+            keys=("tech", "Tech"),
+        ),
+        "technique_enumerated_options": "\n".join(
+            f"""<option value="{index}" data-i18n="{tech}" >{Tech}</option>"""
+            for index, (tech, Tech) in enumerate(TECHNIQUES_PAIRS, start=1)
+        ),
+    }
 )
 
 
 # Form definitions
-form_template = textwrap.dedent(
-    f"""\
-    <tr>
-        <td><input type="text" class="number_3" name="attr_%(Form)s_Score" value="0"/></td>
-        <td data-i18n="%(form)s" >%(Form)s</td>
-        <td>{xp("%(Form)s", factor=1)}</td>
-        <td style="text-align: center"><input type="text" class="number_3 minor" name="attr_%(Form)s_Puissant" value="0"/></td>
-    </tr>"""
-)
-EXPORTS["form_definitions_1"] = repeat_format(
-    form_template, keys="form", values=FORMS[:5]
-)
-EXPORTS["form_definitions_2"] = repeat_format(
-    form_template, keys="form", values=FORMS[5:]
+EXPORTS.update(
+    {
+        "form_definitions_1": repeat_format_pairs(
+            art_template, FORMS_PAIRS[:5], keys=("art", "Art")
+        ),
+        "form_definitions_2": repeat_format_pairs(
+            art_template, FORMS_PAIRS[5:], keys=("art", "Art")
+        ),
+    }
 )
 
 
 # Form options
-EXPORTS["form_score_options"] = repeat_format(
-    """<option value="(@{%(Form)s_Score} + @{%(Form)s_Puissant}) [@{%(form)s_i18n}]" data-i18n="%(form)s" >%(Form)s</option>""",
-    keys="form",
-    values=FORMS,
-)
-EXPORTS["form_score_options_unlabeled"] = repeat_format(
-    """<option value="@{%(Form)s_Score} + @{%(Form)s_Puissant}" data-i18n="%(form)s" >%(Form)s</option>""",
-    keys="form",
-    values=FORMS,
-)
-EXPORTS["form_name_options"] = repeat_format(
-    """<option value="%(Form)s" data-i18n="%(form)s" >%(Form)s</option>""",
-    keys="form",
-    values=FORMS,
-)
-
-EXPORTS["form_enumerated_options"] = "\n".join(
-    f"""<option value="{index}" data-i18n="{form.lower()}" >{form.title()}</option>"""
-    for index, form in enumerate(FORMS, start=1)
+EXPORTS.update(
+    {
+        "form_score_options": repeat_format_pairs(
+            """<option value="(@{%(Form)s_Score} + @{%(Form)s_Puissant}) [@{%(form)s_i18n}]" data-i18n="%(form)s" >%(Form)s</option>""",
+            FORMS_PAIRS,
+            keys=("form", "Form"),
+        ),
+        "form_score_options_unlabeled": repeat_format_pairs(
+            """<option value="@{%(Form)s_Score} + @{%(Form)s_Puissant}" data-i18n="%(form)s" >%(Form)s</option>""",
+            FORMS_PAIRS,
+            keys=("form", "Form"),
+        ),
+        "form_name_options": repeat_format_pairs(
+            """<option value="%(Form)s" data-i18n="%(form)s" >%(Form)s</option>""",
+            FORMS_PAIRS,
+            keys=("form", "Form"),
+        ),
+        "form_enumerated_options": "\n".join(
+            f"""<option value="{index}" data-i18n="{form}" >{Form}</option>"""
+            for index, (form, Form) in enumerate(FORMS_PAIRS, start=1)
+        ),
+    }
 )
 
 
@@ -99,11 +102,11 @@ spontaneous_roll = roll(
     "([[@{Spontaneous1_Focus}]]) [@{focus_i18n}]",
     "(@{gestures})",
     "(@{words})",
-    "(@{Stamina_Score}) [@{stamina_i18n}]",
-    "(@{aura}) [@{aura_i18n}]",
-    "([[floor(@{Fatigue})]]) [@{fatigue_i18n}]",
-    "(@{wound_total}) [@{wounds_i18n}]",
-    "(?{@{modifiers_i18n}|0}) [@{modifiers_i18n}]",
+    ROLL_STAMINA,
+    ROLL_AURA,
+    ROLL_FATIGUE,
+    ROLL_WOUNDS,
+    ROLL_MODIFIERS,
 )
 spontaneous_template = rolltemplate(
     "arcane",
@@ -127,13 +130,13 @@ ceremonial_roll = roll(
     "([[@{Ceremonial_Focus}]]) [@{focus_i18n}]",
     "(@{gestures})",
     "(@{words})",
-    "(@{Stamina_Score}) [@{stamina_i18n}]",
-    "(@{aura}) [@{aura_i18n}]",
-    "([[floor(@{Fatigue})]]) [@{fatigue_i18n}]",
-    "(@{wound_total}) [@{wounds_i18n}]",
+    ROLL_STAMINA,
+    ROLL_AURA,
+    ROLL_FATIGUE,
+    ROLL_WOUNDS,
     "(@{Ceremonial_Artes_Lib}) [@{artes_i18n}]",
     "(@{Ceremonial_Philos}) [@{philos_i18n}]",
-    "(?{@{modifiers_i18n}|0}) [@{modifiers_i18n}]",
+    ROLL_MODIFIERS,
 )
 ceremonial_template = rolltemplate(
     "arcane",
@@ -156,11 +159,11 @@ nf_spontaneous_roll = roll(
     "([[@{Spontaneous2_Focus}]]) [@{focus_i18n}]",
     "(@{gestures})",
     "(@{words})",
-    "(@{Stamina_Score}) [@{stamina_i18n}]",
-    "(@{aura}) [@{aura_i18n}]",
-    "([[floor(@{Fatigue})]]) [@{fatigue_i18n}]",
-    "(@{wound_total}) [@{wounds_i18n}]",
-    "(?{@{modifiers_i18n}|0}) [@{modifiers_i18n}]",
+    ROLL_STAMINA,
+    ROLL_AURA,
+    ROLL_FATIGUE,
+    ROLL_WOUNDS,
+    ROLL_MODIFIERS,
 )
 nf_spontaneous_template = rolltemplate(
     "arcane",
@@ -182,10 +185,11 @@ formulaic_roll = roll(
     "([[@{Formulaic_Focus}]]) [@{focus_i18n}]",
     "(@{gestures})",
     "(@{words})",
-    "(@{Stamina_Score}) [@{stamina_i18n}]",
-    "(@{aura}) [@{aura_i18n}]",
-    "([[floor(@{Fatigue})]]) [@{fatigue_i18n}] + (@{wound_total}) [@{wounds_i18n}]",
-    "(?{@{modifiers_i18n}|0}) [@{modifiers_i18n}]",
+    ROLL_STAMINA,
+    ROLL_AURA,
+    ROLL_FATIGUE,
+    ROLL_WOUNDS,
+    ROLL_MODIFIERS,
 )
 formulaic_template = rolltemplate(
     "arcane",
@@ -198,21 +202,25 @@ formulaic_template = rolltemplate(
     label3="^{circumstances-m}",
     result3="?{@{modifiers_i18n}|0}",
 )
-EXPORTS["formulaic_roll_simple"] = formulaic_template.simple
-EXPORTS["formulaic_roll_stress"] = formulaic_template.stress
+EXPORTS.update(
+    {
+        "formulaic_roll_simple": formulaic_template.simple,
+        "formulaic_roll_stress": formulaic_template.stress,
+    }
+)
 
 
 ritual_roll = roll(
     "@{Ritual_Technique}",
     "@{Ritual_Form}",
     "([[@{Ritual_Focus}]]) [@{focus_i18n}]",
-    "(@{Stamina_Score}) [@{stamina_i18n}]",
-    "(@{aura}) [@{aura_i18n}]",
+    ROLL_STAMINA,
+    ROLL_AURA,
     "(@{Ritual_Artes_Lib}) [@{artes_i18n}]",
     "(@{Ritual_Philos}) [@{philos_i18n}]",
-    "(@{wound_total}) [@{wounds_i18n}]",
+    ROLL_WOUNDS,
     "([[floor(@{fatigue})]]) [@{fatigue_i18n}]",
-    "(?{@{modifiers_i18n}|0}) [@{modifiers_i18n}]",
+    ROLL_MODIFIERS,
 )
 ritual_template = rolltemplate(
     "arcane",
@@ -225,5 +233,9 @@ ritual_template = rolltemplate(
     label3="^{circumstances-m}",
     result3="?{@{modifiers_i18n}|0}",
 )
-EXPORTS["ritual_roll_simple"] = ritual_template.simple
-EXPORTS["ritual_roll_stress"] = ritual_template.stress
+EXPORTS.update(
+    {
+        "ritual_roll_simple": ritual_template.simple,
+        "ritual_roll_stress": ritual_template.stress,
+    }
+)
@@ -1,46 +1,55 @@
-import textwrap
-
-from .helpers import FORMS, repeat_format, roll, rolltemplate
+from .helpers import (
+    FORMS_PAIRS,
+    ROLL_FATIGUE,
+    ROLL_STAMINA,
+    ROLL_WOUNDS,
+    repeat_format,
+    roll,
+    rolltemplate,
+)
 
 EXPORTS = {}
 
 # Additional fatigue levels
 add_fatigue_lvl_num = 10
-EXPORTS["fatigue_levels_options"] = repeat_format(
-    """<option value="%%">%%</option>""",
-    replace="%%",
-    by=list(map(str, range(0, add_fatigue_lvl_num + 1))),
-)
-EXPORTS["additional_fatigue_levels"] = "\n".join(
-    textwrap.dedent(
-        f"""\
-    <tr class="addfatigue-{level}">
-        <td><input type="radio" class="radio_1" name="attr_Fatigue" value="{level / 1000}"><span></span></td>
-        <td style="text-align:center;">0</td>
-        <td>2 min.</td>
-        <td data-i18n="winded" >Winded</td>
-    </tr>"""
-    )
-    for level in range(1, add_fatigue_lvl_num + 1)
+EXPORTS.update(
+    {
+        "fatigue_levels_options": repeat_format(
+            """<option value="%%">%%</option>""",
+            replace="%%",
+            by=list(map(str, range(0, add_fatigue_lvl_num + 1))),
+        ),
+        "additional_fatigue_levels": "\n".join(
+            f"""\
+<tr class="addfatigue-{level}">
+    <td><input type="radio" class="radio_1" name="attr_Fatigue" value="{level / 1000}"><span></span></td>
+    <td style="text-align:center;">0</td>
+    <td>2 min.</td>
+    <td data-i18n="winded" >Winded</td>
+</tr>"""
+            for level in range(1, add_fatigue_lvl_num + 1)
+        ),
+    }
 )
 
 # In the CSS, the replacement is in a comment block
 # We add end-of-comment and start-of-comment syntax atthe begining and end so
 # that it de-comment itself
+# Selectors for the additional fatigue select not being on any value from
+# a level to the last one. Built backward, each level extends the next one
+selectors = [""] * (add_fatigue_lvl_num + 2)
+for level in range(add_fatigue_lvl_num, 0, -1):
+    selectors[level] = (
+        f':not(.sheet-fatigue-proxy[value="{level}"])' + selectors[level + 1]
+    )
+
 lines = ["*/"]
 for level in range(1, add_fatigue_lvl_num + 1):
     # IF the additional fatigue select is not on a value for which the level
     # is visible
-    line = "".join(
-        f':not(.sheet-fatigue-proxy[value="{selector}"])'
-        for selector in range(level, add_fatigue_lvl_num + 1)
-    )
-    line += f" + table tr.sheet-addfatigue-{level} "
-    lines.append(line)
+    lines.append(f"{selectors[level]} + table tr.sheet-addfatigue-{level} ")
     # Then hide it
-    lines.append("{")
-    lines.append("    display: none;")
-    lines.append("}")
+    lines.extend(["{", "    display: none;", "}"])
 lines.append("/*")
 EXPORTS["fatigue_level_css"] = "\n".join(lines)
 
@@ -57,7 +66,7 @@ EXPORTS["soak_total"] = soak_total
 
 # Soak rolltemplate
 soak_roll = roll(
-    "(@{Stamina_Score}) [@{stamina_i18n}]",
+    ROLL_STAMINA,
     "(@{armors_total_prot_detailed}) [@{armor_i18n}]",
     "(@{soak_bonus}) [@{soakbns_i18n}]",
     "(@{combat-mods_total_soak_detailed}) [@{soakbns_i18n}]",
@@ -75,14 +84,12 @@ EXPORTS["soak_roll_stress"] = soak_template.stress
 form_soak_total = roll(
     soak_total, "ceil(((@{%(Form)s_Score}) + (@{%(Form)s_Puissant})) / 5)"
 )
-form_soak_html = textwrap.dedent(
-    f"""\
-    <div class="flex-container-left" style="grid-column: %(col)s / span 1; grid-row: %(row)s / span 1;">
-        <button type="roll" class="button stress-roll single-roll" name="roll_soak_%(form)s" value="%(rollbutton)s"></button>
-        <input type="text" class="number_1" name="attr_Soak_%(Form)s" value="({form_soak_total})" disabled="true"/>
-        <span data-i18n="%(form)s">%(Form)s</span>
-    </div>"""
-)
+form_soak_html = f"""\
+<div class="flex-container-left" style="grid-column: %(col)s / span 1; grid-row: %(row)s / span 1;">
+    <button type="roll" class="button stress-roll single-roll" name="roll_soak_%(form)s" value="%(rollbutton)s"></button>
+    <input type="text" class="number_1" name="attr_Soak_%(Form)s" value="({form_soak_total})" disabled="true"/>
+    <span data-i18n="%(form)s">%(Form)s</span>
+</div>"""
 
 form_soak_roll = roll(
     soak_roll,
@@ -100,10 +107,10 @@ form_soak_template = rolltemplate(
 
 # We do not use repeat_format because we need the index for the grid pos
 soak_by_form_lines = []
-for i, form in enumerate(FORMS):
+for i, (form, Form) in enumerate(FORMS_PAIRS):
     values = {
-        "form": form.lower(),
-        "Form": form.title(),
+        "form": form,
+        "Form": Form,
     }
     values["rollbutton"] = form_soak_template.stress % values
     values.update(
@@ -134,8 +141,8 @@ init_roll = (
     )
     + (" - (@{Init_Encumbrance}) [@{encumbrance_i18n}] + ")
     + roll(
-        "([[floor(@{Fatigue})]]) [@{fatigue_i18n}]",
-        "(@{wound_total}) [@{wounds_i18n}]",
+        ROLL_FATIGUE,
+        ROLL_WOUNDS,
         "(?{@{initiative_i18n} @{modifiers_i18n}|0}) [@{initiative_i18n} @{modifiers_i18n}]",
     )
 )
@@ -163,8 +170,8 @@ atk_roll = roll(
     "(@{WeaponAbility}) [@{ability_i18n}]",
     "(@{combat-mods_total_atk}) [@{bonus_i18n}]",
     "(@{Atk_Weap}) [@{Weapon_name}]",
-    "(@{wound_total}) [@{wounds_i18n}]",
-    "([[floor(@{Fatigue})]]) [@{fatigue_i18n}]",
+    ROLL_WOUNDS,
+    ROLL_FATIGUE,
     "(?{@{circumstantial_i18n} @{attack_i18n}|0}) [@{circumstantial_i18n} @{attack_i18n}]",
 )
 dam_roll = roll(
@@ -198,8 +205,8 @@ dfn_roll = roll(
     "(@{WeaponAbility}) [@{ability_i18n}]",
     "(@{combat-mods_total_dfn}) [@{bonus_i18n}]",
     "(@{Dfn_Weap}) [@{Weapon_name}]",
-    "(@{wound_total}) [@{wounds_i18n}]",
-    "([[floor(@{Fatigue})]]) [@{fatigue_i18n}]",
+    ROLL_WOUNDS,
+    ROLL_FATIGUE,
     "(?{@{circumstantial_i18n} @{defense_i18n}|0}) [@{circumstantial_i18n} @{defense_i18n}]",
 )
 dfn_template = rolltemplate(
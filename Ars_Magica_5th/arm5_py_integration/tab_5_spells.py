@@ -1,4 +1,12 @@
-from .helpers import roll, rolltemplate
+from .helpers import (
+    ROLL_AURA,
+    ROLL_FATIGUE,
+    ROLL_MODIFIERS,
+    ROLL_STAMINA,
+    ROLL_WOUNDS,
+    roll,
+    rolltemplate,
+)
 
 EXPORTS = {}
 
@@ -19,22 +27,26 @@ spell_form_value = (
     "[@{sys_at}@{character_name}@{sys_pipe}@{spell_form_name}_i18n@{sys_rbk}]"
 )
 # Export the deferred attribute access for use in the HTML since the focus depends on them
-EXPORTS["spell_tech_value"] = spell_tech_value
-EXPORTS["spell_form_value"] = spell_form_value
+EXPORTS.update(
+    {
+        "spell_tech_value": spell_tech_value,
+        "spell_form_value": spell_form_value,
+    }
+)
 
 # Formulaic spell rolls
 spell_roll = roll(
-    "(@{Stamina_Score}) [@{stamina_i18n}]",
+    ROLL_STAMINA,
     f"{spell_tech_value}",
     f"{spell_form_value}",
     "([[@{spell_Focus}]]) [@{focus_i18n}]",
     "(@{spell_bonus}) [@{bonus_i18n}]",
     "(@{gestures})",
     "(@{words})",
-    "(@{aura}) [@{aura_i18n}]",
-    "([[floor(@{Fatigue})]]) [@{fatigue_i18n}]",
-    "(@{wound_total}) [@{wounds_i18n}]",
-    "(?{@{modifiers_i18n}|0}) [@{modifiers_i18n}]",
+    ROLL_AURA,
+    ROLL_FATIGUE,
+    ROLL_WOUNDS,
+    ROLL_MODIFIERS,
 )
 spell_template = rolltemplate(
     "spell",
@@ -51,8 +63,12 @@ spell_template = rolltemplate(
     Form="@{sys_at}@{character_name}@{sys_pipe}@{spell_form_name}_i18n@{sys_rbk}",
     Level="@{spell_level}",
 )
-EXPORTS["spell_roll_simple"] = spell_template.simple
-EXPORTS["spell_roll_stress"] = spell_template.stress
+EXPORTS.update(
+    {
+        "spell_roll_simple": spell_template.simple,
+        "spell_roll_stress": spell_template.stress,
+    }
+)
 
 # Spontaneous spell rolls
 spont_template = rolltemplate(
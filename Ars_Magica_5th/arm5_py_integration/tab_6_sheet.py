@@ -1,37 +1,88 @@
-from pathlib import Path
+import hashlib
+import re
+from types import CodeType
 
 import markdown
-from bs4 import BeautifulSoup as soup
+
+from .helpers import SHEET_DIR
 
 EXPORTS = {}
 
-# Convert the documentation.md file into HTML
-with open(Path(__file__).parents[1] / "documentation.md") as f:
-    html = markdown.markdown("".join(f))
+DOCUMENTATION = SHEET_DIR / "documentation.md"
+CHANGELOG = SHEET_DIR / "changelog.md"
+# The rendered documentation is cached next to its source, with a header line
+# holding a digest of the renderer, and the mtime and hash of the markdown it
+# was rendered from
+DOCUMENTATION_CACHE = DOCUMENTATION.with_name("documentation.md.html")
 
-html = soup(html, "html.parser")
+# markdown produces plain, well-formed tags, so the few changes made to its
+# output are done with regexes rather than by parsing the HTML
+RE_HEADING = re.compile(r"<(h[1-9])([^>]*)>")
+RE_CODE_OPEN = re.compile(r"<code([^>]*)>")
 
-# Add the CSS class to the headings
-for i in range(1, 10):
-    for tag in html.find_all(f"h{i}"):
-        tag.attrs["class"] = tag.get("class", "") + " heading_label"
-# Convert code tags to span with a class, because Roll20 removes code tags
-for tag in html.find_all("code"):
-    tag.name = "span"
-    tag.attrs["class"] = tag.get("class", "") + " codespan"
 
-EXPORTS["documentation"] = html.prettify()
+def _add_heading_class(html: str) -> str:
+    """
+    Add the CSS class to the headings
+    """
+    return RE_HEADING.sub(r'<\1\2 class=" heading_label">', html)
 
 
-# Convert the changelog.md file into HTML
-with open(Path(__file__).parents[1] / "changelog.md") as f:
-    html = markdown.markdown("".join(f))
+def _build_documentation(text: str) -> str:
+    """
+    Convert the content of the documentation.md file into HTML
+    """
+    html = _add_heading_class(markdown.markdown(text))
+    # Convert code tags to span with a class, because Roll20 removes code tags
+    html = RE_CODE_OPEN.sub(r'<span\1 class=" codespan">', html)
+    return html.replace("</code>", "</span>")
+
+
+def _renderer_digest() -> str:
+    """
+    Digest of the markdown version and of the code rendering the documentation
+    """
+    digest = hashlib.blake2b(markdown.__version__.encode())
+    for regex in (RE_HEADING, RE_CODE_OPEN):
+        digest.update(regex.pattern.encode())
+    for function in (_add_heading_class, _build_documentation):
+        code = function.__code__
+        digest.update(code.co_code)
+        # Nested code objects are left out, their repr holds their address
+        consts = [c for c in code.co_consts if not isinstance(c, CodeType)]
+        digest.update(repr(consts).encode())
+    return digest.hexdigest()
+
 
-html = soup(html, "html.parser")
+def _cached_documentation() -> str:
+    """
+    Get the documentation HTML, only re-rendering it if documentation.md changed
+    """
+    data = DOCUMENTATION.read_bytes()
+    key = "<!-- %s %s %s -->\n" % (
+        _renderer_digest(),
+        DOCUMENTATION.stat().st_mtime_ns,
+        hashlib.blake2b(data).hexdigest(),
+    )
+    try:
+        cached = DOCUMENTATION_CACHE.read_text(encoding="utf-8")
+    except OSError:
+        cached = ""
+    if cached.startswith(key):
+        return cached[len(key) :]
 
-# Add the CSS class to the headings
-for i in range(1, 10):
-    for tag in html.find_all(f"h{i}"):
-        tag.attrs["class"] = " ".join(tag.get("class", "").split(" ") + ["heading_label"])
+    html = _build_documentation(data.decode("utf-8"))
+    try:
+        DOCUMENTATION_CACHE.write_text(key + html, encoding="utf-8")
+    except OSError:
+        # The cache is optional, e.g. on a read-only checkout
+        pass
+    return html
 
-EXPORTS["changelog"] = html.prettify()
+
+EXPORTS["documentation"] = _cached_documentation()
+
+
+# Convert the changelog.md file into HTML
+with open(CHANGELOG) as f:
+    EXPORTS["changelog"] = _add_heading_class(markdown.markdown("".join(f)))
@@ -1,4 +1,4 @@
-from .helpers import CHARACTERISTICS, FORMS, TECHNIQUES
+from .helpers import CHARACTERISTICS_PAIRS, FORMS_PAIRS, TECHNIQUES_PAIRS
 
 # list of (attr, default, translation_key)
 TRANSLATION_ATTRS = (
@@ -44,9 +44,9 @@ TRANSLATION_ATTRS = (
         ("words-none", "None", "words-none"),
         ("wounds", "Wounds", "wounds"),
     ]
-    + [(char.lower(), char.capitalize(), char.lower()) for char in CHARACTERISTICS]
-    + [(tech.lower(), tech.capitalize(), tech.lower()) for tech in TECHNIQUES]
-    + [(form.lower(), form.capitalize(), form.lower()) for form in FORMS]
+    + [(char, Char, char) for char, Char in CHARACTERISTICS_PAIRS]
+    + [(tech, Tech, tech) for tech, Tech in TECHNIQUES_PAIRS]
+    + [(form, Form, form) for form, Form in FORMS_PAIRS]
 )
 
 translation_attrs = "\n".join(